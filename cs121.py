@@ -1,4 +1,43 @@
-import random
+import functools
+import math
+import os
+from array import array
+from dataclasses import dataclass
+from multiprocessing import Pool
+
+import numpy as np
+
+try:
+    from numba import njit
+    _numba_available = True
+except ImportError:  # Numba is optional; without it the round kernel runs as plain Python.
+    _numba_available = False
+
+try:
+    # Compiled from cs121_kernel.pyx with `cythonize -i cs121_kernel.pyx`.
+    from cs121_kernel import simulate_rounds as _simulate_rounds_cython
+except ImportError:
+    _simulate_rounds_cython = None
+
+
+@dataclass
+class History:
+    """Per-round history of a simulated game, one array per field indexed by round."""
+    round: np.ndarray
+    ai_invests_high: np.ndarray
+    auditor_pays_for_check: np.ndarray
+    signal_bias: np.ndarray
+    wager_placed: np.ndarray
+    ai_safety_effect: np.ndarray
+    auditor_check_effect: np.ndarray
+    ai_wager_effect: np.ndarray
+    auditor_wager_effect: np.ndarray
+    incremental_ai: np.ndarray
+    incremental_auditor: np.ndarray
+    ftc_surplus: np.ndarray
+    cumulative_ai: np.ndarray
+    cumulative_auditor: np.ndarray
+
 
 def simulate_game(
     n_rounds=50,
@@ -9,7 +48,8 @@ def simulate_game(
     kept_amount = .9,        # Amount not kept by FTC
     auditor_check_cost=5,    # Cost for Auditor's thorough check
     wager_amount=50,         # Amount Auditor risks if filing a report
-    fine_amount=1000         # Fine on AI Company if bias is confirmed
+    fine_amount=1000,        # Fine on AI Company if bias is confirmed
+    seed=None                # Seed for the NumPy random Generator
 ):
     """
     In each round:
@@ -30,82 +70,314 @@ def simulate_game(
       - AI Company: incremental_ai = ai_safety_effect + ai_wager_effect
       - Auditor: incremental_auditor = auditor_check_effect + auditor_wager_effect
 
-    Returns a history of rounds with:
+    All rounds are simulated at once with NumPy: the random decisions are drawn
+    as batched arrays and each effect is computed with boolean masks, by a kernel
+    generated with the parameter set baked in as literals (see _compile_kernel).
+
+    Returns a History of rounds, holding one array per field with:
       - Decisions and individual incremental effects.
       - Overall round outcomes (incremental_ai, incremental_auditor).
     """
-    history = []
-    cumulative_ai = 0
-    cumulative_auditor = 0
+    coins, u = _draw_rounds(np.random.default_rng(seed), n_rounds)
+    kernel = _specialized_kernel(cost_high_safety, cost_low_safety, prob_bias_high,
+                                 prob_bias_low, kept_amount, auditor_check_cost,
+                                 wager_amount, fine_amount)
+    return _build_history(*kernel(coins, u))
+
+
+def _draw_rounds(rng, n_rounds):
+    """
+    Draw every random decision up front: the two coin flips of each round as an
+    (n_rounds, 2) boolean array, and one uniform per round that decides the signal
+    and the bias confirmation jointly. Both simulate_game variants draw through here,
+    so one seed gives one history.
+    """
+    coins = rng.integers(0, 2, size=(n_rounds, 2), dtype=np.bool_)
+    u = rng.random(n_rounds, dtype=np.float64)
+    return coins, u
+
+
+_KERNEL_TEMPLATE = """
+# Signal thresholds depend only on the two decisions, so look them up in a
+# 2x2 table indexed by [ai_invests_high, auditor_pays_for_check].
+signal_thresh_table = np.array([[{prob_bias_low}, {checked_thresh_low}],
+                                [{prob_bias_high}, {checked_thresh_high}]])
+# Wager payoffs by outcome: 0 is no signal, 1 a false positive, 2 a true positive.
+auditor_payoffs = np.array([0.0, {fp_auditor}, {tp_auditor}])
+ai_payoffs = np.array([0.0, {fp_ai}, {tp_ai}])
+ftc_payoffs = np.array([0.0, {fp_ftc}, {tp_ftc}])
+
+
+def kernel(coins, u):
+    # 1. AI Company Safety Investment
+    ai_invests_high = np.ascontiguousarray(coins[:, 0])
+    prob_bias = np.where(ai_invests_high, {prob_bias_high}, {prob_bias_low})
+    ai_safety_effect = np.where(ai_invests_high, {ai_safety_high}, {ai_safety_low})
+
+    # 2. Auditor Check Decision for due diligence (with check, better detection):
+    auditor_pays_for_check = np.ascontiguousarray(coins[:, 1])
+    auditor_check_effect = np.where(auditor_pays_for_check, {check_effect}, 0.0)
+    signal_thresh = signal_thresh_table[ai_invests_high.view(np.uint8),
+                                        auditor_pays_for_check.view(np.uint8)]
+    signal_bias = u < signal_thresh
+
+    # 3. Wager Decision: a wager is placed whenever a bias signal is generated.
+    wager_placed = signal_bias.copy()
+    # Given a signal, u / signal_thresh is uniform, so u < signal_thresh * prob_bias
+    # confirms the bias with probability prob_bias. Each wager effect is a gather
+    # from that party's payoff table.
+    true_positive = u < signal_thresh * prob_bias
+    outcome = signal_bias.view(np.uint8) + true_positive.view(np.uint8)
+    auditor_wager_effect = auditor_payoffs[outcome]
+    ai_wager_effect = ai_payoffs[outcome]
+    ftc_surplus = ftc_payoffs[outcome]
+
+    return (ai_invests_high, auditor_pays_for_check, signal_bias, wager_placed,
+            ai_safety_effect, auditor_check_effect, ai_wager_effect,
+            auditor_wager_effect, ftc_surplus)
+"""
+
+
+def _float_literal(value):
+    """Render a float as Python source; inf and nan have no literal of their own."""
+    return repr(value) if math.isfinite(value) else "float('%s')" % value
+
+
+def _specialized_kernel(*params):
+    """
+    Return the vectorized kernel behind simulate_game for this parameter set. The
+    kernel maps the pre-drawn coin flips and uniforms to the per-round arrays, in
+    the argument order of _build_history.
+    """
+    return _compile_kernel(*map(float, params))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_kernel(cost_high_safety, cost_low_safety, prob_bias_high, prob_bias_low,
+                    kept_amount, auditor_check_cost, wager_amount, fine_amount):
+    """
+    Generate the kernel from _KERNEL_TEMPLATE with this parameter set and every
+    constant derived from it baked in as literals. Kernels are cached by parameter
+    tuple.
+    """
+    # True Positive: net gain to the Auditor is the kept share of the fine.
+    # False Positive: Auditor loses the wager, AI Company recovers half of it.
+    tp_auditor, fp_auditor = fine_amount * kept_amount, -wager_amount
+    tp_ai, fp_ai = -fine_amount, wager_amount * 0.5 * kept_amount
+    tp_ftc, fp_ftc = (fine_amount + wager_amount) - tp_auditor, wager_amount - fp_ai
+    constants = {
+        'prob_bias_high': prob_bias_high,
+        'prob_bias_low': prob_bias_low,
+        'checked_thresh_high': prob_bias_high * 0.9 + (1 - prob_bias_high) * 0.1,
+        'checked_thresh_low': prob_bias_low * 0.9 + (1 - prob_bias_low) * 0.1,
+        'ai_safety_high': -cost_high_safety,
+        'ai_safety_low': -cost_low_safety,
+        'check_effect': -auditor_check_cost,
+        'tp_auditor': tp_auditor,
+        'fp_auditor': fp_auditor,
+        'tp_ai': tp_ai,
+        'fp_ai': fp_ai,
+        'tp_ftc': tp_ftc,
+        'fp_ftc': fp_ftc
+    }
+    source = _KERNEL_TEMPLATE.format(**{name: _float_literal(value)
+                                         for name, value in constants.items()})
+    namespace = {'np': np}
+    exec(compile(source, '<simulate_game kernel>', 'exec'), namespace)
+    return namespace['kernel']
+
+
+def _play_rounds(coins, u, cost_high_safety, cost_low_safety, prob_bias_high,
+                 prob_bias_low, kept_amount, auditor_check_cost, wager_amount,
+                 fine_amount, ai_invests_high, auditor_pays_for_check, signal_bias,
+                 ai_safety_effect, auditor_check_effect, ai_wager_effect,
+                 auditor_wager_effect, ftc_surplus):
+    """
+    Per-round loop behind simulate_game_loop, writing each round into the given
+    output columns. The random draws are passed in pre-drawn: coins holds both coin
+    flips of a round as two bits, and u holds the one uniform that decides the
+    round's signal and bias confirmation.
+    """
+    n_rounds = len(coins)
+    tp_auditor, fp_auditor = fine_amount * kept_amount, -wager_amount
+    tp_ai, fp_ai = -fine_amount, wager_amount * 0.5 * kept_amount
+    tp_ftc, fp_ftc = (fine_amount + wager_amount) - tp_auditor, wager_amount - fp_ai
+    # Wager payoffs indexed by bias confirmation: 0 is a false positive, 1 a true positive.
+    auditor_payoffs = (fp_auditor, tp_auditor)
+    ai_payoffs = (fp_ai, tp_ai)
+    ftc_payoffs = (fp_ftc, tp_ftc)
+    checked_thresh_high = prob_bias_high * 0.9 + (1 - prob_bias_high) * 0.1
+    checked_thresh_low = prob_bias_low * 0.9 + (1 - prob_bias_low) * 0.1
+
     for round_i in range(n_rounds):
         # 1. AI Company Safety Investment
-        ai_invests_high = random.choice([True, False])
-        if ai_invests_high:
+        ai_high = (coins[round_i] & 1) == 1
+        if ai_high:
             prob_bias = prob_bias_high
-            ai_safety_effect = -cost_high_safety
+            checked_thresh = checked_thresh_high
+            ai_safety_effect[round_i] = -cost_high_safety
         else:
             prob_bias = prob_bias_low
-            ai_safety_effect = -cost_low_safety
+            checked_thresh = checked_thresh_low
+            ai_safety_effect[round_i] = -cost_low_safety
 
         # 2. Auditor Check Decision for due diligence:
-        auditor_pays_for_check = random.choice([True, False])
-        if auditor_pays_for_check:
-            auditor_check_effect = -auditor_check_cost
-            # With check, better detection
-            signal_bias = random.random() < (prob_bias * 0.9 + (1 - prob_bias) * 0.1)
+        pays_for_check = (coins[round_i] >> 1) == 1
+        if pays_for_check:
+            auditor_check_effect[round_i] = -auditor_check_cost
+            signal_thresh = checked_thresh
         else:
-            auditor_check_effect = 0
-            signal_bias = random.random() < prob_bias
-
-        # 3. Wager Decision
-        if signal_bias:
-            wager_placed = True
-            # Auditor pays wager cost.
-            auditor_wager_effect = -wager_amount
-            is_biased = random.random() < prob_bias
-            if is_biased:
-                # True Positive:
-                auditor_wager_effect += fine_amount * kept_amount + wager_amount   # net gain = fine_amount
-                ai_wager_effect = -fine_amount
-                FTC_surplus = (fine_amount + wager_amount) - auditor_wager_effect
-            else:
-                # False Positive:
-                auditor_wager_effect = -wager_amount
-                ai_wager_effect = wager_amount * 0.5 * kept_amount
-                FTC_surplus = wager_amount - ai_wager_effect
-        else:
-            wager_placed = False
-            auditor_wager_effect = 0
-            ai_wager_effect = 0
-            FTC_surplus = 0 
-
-        incremental_ai = ai_safety_effect + ai_wager_effect
-        incremental_auditor = auditor_check_effect + auditor_wager_effect
-
-        cumulative_ai += incremental_ai
-        cumulative_auditor += incremental_auditor
-
-        history.append({
-            'round': round_i + 1,
-            'ai_invests_high': ai_invests_high,
-            'auditor_pays_for_check': auditor_pays_for_check,
-            'signal_bias': signal_bias,
-            'wager_placed': wager_placed,
-            'ai_safety_effect': ai_safety_effect,
-            'auditor_check_effect': auditor_check_effect,
-            'ai_wager_effect': ai_wager_effect,
-            'auditor_wager_effect': auditor_wager_effect,
-            'incremental_ai': incremental_ai,
-            'incremental_auditor': incremental_auditor,
-            'cumulative_ai': cumulative_ai,
-            'cumulative_auditor': cumulative_auditor,
-            'ftc_surplus': FTC_surplus
-        })
-    
-    return history, cumulative_ai, cumulative_auditor
+            auditor_check_effect[round_i] = 0
+            signal_thresh = prob_bias
+
+        # 3. Wager Decision. One uniform decides signal and bias jointly. No signal is
+        # the common case, so it is the fall-through with zero wager effects; with a
+        # signal, the bias confirmation indexes the payoff tables without a branch.
+        v = u[round_i]
+        signal = v < signal_thresh
+        auditor_wager_effect[round_i] = 0
+        ai_wager_effect[round_i] = 0
+        ftc_surplus[round_i] = 0
+        if signal:
+            confirmed = int(v < signal_thresh * prob_bias)
+            auditor_wager_effect[round_i] = auditor_payoffs[confirmed]
+            ai_wager_effect[round_i] = ai_payoffs[confirmed]
+            ftc_surplus[round_i] = ftc_payoffs[confirmed]
+
+        ai_invests_high[round_i] = ai_high
+        auditor_pays_for_check[round_i] = pays_for_check
+        signal_bias[round_i] = signal
 
 
-def summarize_buckets(history):
+if _numba_available:
+    _play_rounds_compiled = njit(cache=True)(_play_rounds)
+
+
+def _simulate_rounds(coins, u, *params):
+    """
+    Run _play_rounds, compiled with Numba when it is installed. Returns one array per
+    decision and effect, in the argument order of _build_history.
+
+    Without Numba the loop runs in the interpreter, where NumPy arrays are slow to
+    read and write one element at a time, so it reads the draws as lists and writes
+    into array.array columns of unboxed C bytes and doubles that NumPy then wraps
+    without copying.
+    """
+    n_rounds = len(coins)
+    if _numba_available:
+        flags = [np.empty(n_rounds, dtype=np.bool_) for _ in range(3)]
+        effects = [np.empty(n_rounds, dtype=np.float64) for _ in range(5)]
+        _play_rounds_compiled(coins, u, *params, *flags, *effects)
+    else:
+        flags = [array('b', [0]) * n_rounds for _ in range(3)]
+        effects = [array('d', [0.0]) * n_rounds for _ in range(5)]
+        _play_rounds(coins.tolist(), u.tolist(), *params, *flags, *effects)
+        flags = [np.frombuffer(column, dtype=np.bool_) for column in flags]
+        effects = [np.frombuffer(column, dtype=np.float64) for column in effects]
+    ai_invests_high, auditor_pays_for_check, signal_bias = flags
+    return (ai_invests_high, auditor_pays_for_check, signal_bias, signal_bias.copy(), *effects)
+
+
+def simulate_game_loop(
+    n_rounds=50,
+    cost_high_safety=100,
+    cost_low_safety=40,
+    prob_bias_high=0.05,
+    prob_bias_low=0.3,
+    kept_amount = .9,
+    auditor_check_cost=5,
+    wager_amount=50,
+    fine_amount=1000,
+    seed=None
+):
+    """
+    Round-by-round variant of simulate_game with the same parameters and return value.
+    It makes the same draws as simulate_game, so the same seed gives the same history.
+
+    The rounds are played one at a time in the Cython kernel from cs121_kernel.pyx if
+    it has been built, and otherwise in _simulate_rounds (compiled with Numba when it
+    is installed).
+    """
+    coins, u = _draw_rounds(np.random.default_rng(seed), n_rounds)
+    # The kernels take both coin flips of a round packed into the two low bits.
+    packed = coins[:, 0].astype(np.int64) | (coins[:, 1].astype(np.int64) << 1)
+    kernel = _simulate_rounds_cython or _simulate_rounds
+    params = map(float, (cost_high_safety, cost_low_safety, prob_bias_high, prob_bias_low,
+                         kept_amount, auditor_check_cost, wager_amount, fine_amount))
+    columns = kernel(packed, u, *params)
+    return _build_history(*columns)
+
+
+def _build_history(ai_invests_high, auditor_pays_for_check, signal_bias, wager_placed,
+                   ai_safety_effect, auditor_check_effect, ai_wager_effect,
+                   auditor_wager_effect, ftc_surplus):
+    """
+    Assemble the per-round arrays into the History returned by simulate_game,
+    adding the overall round outcomes and cumulative payoffs.
+    """
+    n_rounds = len(ai_invests_high)
+    incremental_ai = ai_safety_effect + ai_wager_effect
+    incremental_auditor = auditor_check_effect + auditor_wager_effect
+    cumulative_ai = np.cumsum(incremental_ai)
+    cumulative_auditor = np.cumsum(incremental_auditor)
+
+    history = History(
+        round=np.arange(1, n_rounds + 1),
+        ai_invests_high=ai_invests_high,
+        auditor_pays_for_check=auditor_pays_for_check,
+        signal_bias=signal_bias,
+        wager_placed=wager_placed,
+        ai_safety_effect=ai_safety_effect,
+        auditor_check_effect=auditor_check_effect,
+        ai_wager_effect=ai_wager_effect,
+        auditor_wager_effect=auditor_wager_effect,
+        incremental_ai=incremental_ai,
+        incremental_auditor=incremental_auditor,
+        ftc_surplus=ftc_surplus,
+        cumulative_ai=cumulative_ai,
+        cumulative_auditor=cumulative_auditor
+    )
+
+    final_cum_ai = cumulative_ai[-1] if n_rounds else 0
+    final_cum_auditor = cumulative_auditor[-1] if n_rounds else 0
+    return history, final_cum_ai, final_cum_auditor
+
+
+def _run_replication_shard(seeds, n_rounds, params):
+    """Play one replication per seed and return the final payoffs of each."""
+    final_ai = np.empty(len(seeds))
+    final_auditor = np.empty(len(seeds))
+    for i, seed in enumerate(seeds):
+        _, final_ai[i], final_auditor[i] = simulate_game(n_rounds=n_rounds, seed=seed, **params)
+    return final_ai, final_auditor
+
+
+def run_replications(n_reps, n_rounds=50, seed=None, processes=None, **params):
+    """
+    Run n_reps independent replications of simulate_game across a multiprocessing Pool.
+
+    Each replication gets its own child of np.random.SeedSequence(seed), so the
+    streams never collide across workers and the whole sweep is reproducible from
+    seed. Any other keyword arguments are passed through to simulate_game.
+
+    Returns arrays of the final cumulative AI Company and Auditor payoffs, one entry
+    per replication.
+    """
+    if n_reps == 0:
+        return np.empty(0), np.empty(0)
+    child_seeds = np.random.SeedSequence(seed).spawn(n_reps)
+    processes = min(processes or os.cpu_count() or 1, n_reps)
+    shards = [shard for shard in np.array_split(np.array(child_seeds, dtype=object), processes)
+              if len(shard)]
+    with Pool(processes) as pool:
+        results = pool.starmap(_run_replication_shard,
+                               [(shard, n_rounds, params) for shard in shards])
+    final_ai = np.concatenate([shard_ai for shard_ai, _ in results])
+    final_auditor = np.concatenate([shard_auditor for _, shard_auditor in results])
+    return final_ai, final_auditor
+
+
+def summarize(history):
     """
     For each decision bucket, group rounds by whether the decision was True or False,
     and record the overall round outcome for each party.
@@ -113,62 +385,41 @@ def summarize_buckets(history):
       - For auditor_pays_for_check: record incremental_auditor for rounds where it's True, else 0.
       - For wager_placed: record incremental_ai and incremental_auditor for rounds where it's True, else 0.
     Then compute the average outcome for each bucket.
+
+    All buckets are reduced in one sweep: the three decisions are packed into a
+    3-bit code per round, np.bincount groups the counts and each outcome column into
+    8 bins at once, and every bucket's True/False sums are then read off the bins
+    whose bit for that decision is set or clear.
     """
-    buckets = {
-        'ai_invests_high': {
-            'true': {'ai': [], 'auditor': [], 'ftc_surplus': []},
-            'false': {'ai': [], 'auditor': [], 'ftc_surplus': []}
-        },
-        'auditor_pays_for_check': {
-            'true': {'ai': [], 'auditor': [], 'ftc_surplus': []},
-            'false': {'ai': [], 'auditor': [], 'ftc_surplus': []}
-        },
-        'wager_placed': {
-            'true': {'ai': [], 'auditor': [], 'ftc_surplus': []},
-            'false': {'ai': [], 'auditor': [], 'ftc_surplus': []}
-        }
-    }
-    
-    for round_info in history:
-        # For ai_invests_high, record overall incremental outcome for AI Company and FTC surplus.
-        if round_info['ai_invests_high']:
-            buckets['ai_invests_high']['true']['ai'].append(round_info['incremental_ai'])
-            buckets['ai_invests_high']['true']['auditor'].append(round_info['incremental_auditor'])
-            buckets['ai_invests_high']['true']['ftc_surplus'].append(round_info['ftc_surplus'])
-        else:
-            buckets['ai_invests_high']['false']['ai'].append(round_info['incremental_ai'])
-            buckets['ai_invests_high']['false']['auditor'].append(round_info['incremental_auditor'])
-            buckets['ai_invests_high']['false']['ftc_surplus'].append(round_info['ftc_surplus'])
-            
-        # For auditor_pays_for_check, record overall incremental outcome for Auditor and FTC surplus.
-        if round_info['auditor_pays_for_check']:
-            buckets['auditor_pays_for_check']['true']['auditor'].append(round_info['incremental_auditor'])
-            buckets['auditor_pays_for_check']['true']['ai'].append(round_info['incremental_ai'])
-            buckets['auditor_pays_for_check']['true']['ftc_surplus'].append(round_info['ftc_surplus'])
-        else:
-            buckets['auditor_pays_for_check']['false']['auditor'].append(round_info['incremental_auditor'])
-            buckets['auditor_pays_for_check']['false']['ai'].append(round_info['incremental_ai'])
-            buckets['auditor_pays_for_check']['false']['ftc_surplus'].append(round_info['ftc_surplus'])
-            
-        # For wager_placed, record overall round outcome if wager was placed; else 0, and FTC surplus.
-        if round_info['wager_placed']:
-            buckets['wager_placed']['true']['ai'].append(round_info['incremental_ai'])
-            buckets['wager_placed']['true']['auditor'].append(round_info['incremental_auditor'])
-            buckets['wager_placed']['true']['ftc_surplus'].append(round_info['ftc_surplus'])
-        else:
-            buckets['wager_placed']['false']['ai'].append(0)
-            buckets['wager_placed']['false']['auditor'].append(0)
-            buckets['wager_placed']['false']['ftc_surplus'].append(0)
-    
+    code = (history.ai_invests_high.astype(np.uint8)
+            | (history.auditor_pays_for_check.astype(np.uint8) << 1)
+            | (history.wager_placed.astype(np.uint8) << 2))
+    counts = np.bincount(code, minlength=8)
+    # One row of 8 bin sums per outcome: incremental_ai, incremental_auditor, ftc_surplus.
+    bin_sums = np.array([np.bincount(code, weights=column, minlength=8)
+                         for column in (history.incremental_ai,
+                                        history.incremental_auditor,
+                                        history.ftc_surplus)])
+    bins = np.arange(8)
+
     summary = {}
-    for bucket, groups in buckets.items():
+    for bit, bucket in enumerate(('ai_invests_high', 'auditor_pays_for_check', 'wager_placed')):
+        in_true = (bins >> bit) & 1 == 1
+        count_true = int(counts[in_true].sum())
+        count_false = int(counts[~in_true].sum())
+        sums_true = bin_sums[:, in_true].sum(axis=1)
+        if bucket == 'wager_placed':
+            # wager_placed records 0 for rounds without a wager rather than the round
+            # outcome, so its False averages are 0.
+            sums_false = np.zeros(3)
+        else:
+            sums_false = bin_sums[:, ~in_true].sum(axis=1)
         summary[bucket] = {}
-        for group, outcomes in groups.items():
-            avg_ai = sum(outcomes['ai']) / len(outcomes['ai']) if outcomes['ai'] else 0
-            avg_auditor = sum(outcomes['auditor']) / len(outcomes['auditor']) if outcomes['auditor'] else 0
-            avg_ftc_surplus = sum(outcomes['ftc_surplus']) / len(outcomes['ftc_surplus']) if outcomes['ftc_surplus'] else 0
+        for group, count, sums in (('true', count_true, sums_true),
+                                   ('false', count_false, sums_false)):
+            avg_ai, avg_auditor, avg_ftc_surplus = sums / count if count else (0, 0, 0)
             summary[bucket][group] = {
-                'count': len(outcomes['ai']),
+                'count': count,
                 'avg_ai_outcome': avg_ai,
                 'avg_auditor_outcome': avg_auditor,
                 'avg_ftc_surplus': avg_ftc_surplus
@@ -176,9 +427,9 @@ def summarize_buckets(history):
     return summary
 
 def main():
-    random.seed(42)  # For reproducibility.
-    history, final_cum_ai, final_cum_auditor = simulate_game(n_rounds=5000)
-    bucket_summary = summarize_buckets(history)
+    # Seeded for reproducibility.
+    history, final_cum_ai, final_cum_auditor = simulate_game(n_rounds=5000, seed=42)
+    bucket_summary = summarize(history)
 
     print("Final Cumulative AI Company Payoff:", final_cum_ai)
     print("Final Cumulative Auditor Payoff:", final_cum_auditor)
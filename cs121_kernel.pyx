@@ -0,0 +1,107 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional Cython build of the per-round kernel used by cs121.simulate_game_loop.
+
+Build in place with `cythonize -i cs121_kernel.pyx`; simulate_game_loop picks the
+compiled module up automatically and otherwise falls back to the Numba kernel.
+"""
+import numpy as np
+
+from libc.stdint cimport int64_t
+
+cdef extern from *:
+    # Branch hint macro defined in every Cython-generated C file.
+    bint unlikely(bint condition)
+
+
+cpdef tuple simulate_rounds(const int64_t[::1] coins, const double[::1] u,
+                            double cost_high_safety, double cost_low_safety,
+                            double prob_bias_high, double prob_bias_low,
+                            double kept_amount, double auditor_check_cost,
+                            double wager_amount, double fine_amount):
+    """
+    Same contract as cs121._simulate_rounds: coins holds both coin flips of a round
+    as two bits, u the one uniform that decides the round's signal and bias
+    confirmation. Returns one array per decision and effect, in the argument order
+    of cs121._build_history.
+    """
+    cdef Py_ssize_t n_rounds = coins.shape[0]
+    cdef Py_ssize_t round_i
+    cdef double tp_auditor = fine_amount * kept_amount
+    cdef double fp_auditor = -wager_amount
+    cdef double tp_ai = -fine_amount
+    cdef double fp_ai = wager_amount * 0.5 * kept_amount
+    cdef double tp_ftc = (fine_amount + wager_amount) - tp_auditor
+    cdef double fp_ftc = wager_amount - fp_ai
+    cdef double checked_thresh_high = prob_bias_high * 0.9 + (1 - prob_bias_high) * 0.1
+    cdef double checked_thresh_low = prob_bias_low * 0.9 + (1 - prob_bias_low) * 0.1
+    # Wager payoffs indexed by bias confirmation: 0 is a false positive, 1 a true positive.
+    cdef double auditor_payoffs[2]
+    cdef double ai_payoffs[2]
+    cdef double ftc_payoffs[2]
+    auditor_payoffs[:] = [fp_auditor, tp_auditor]
+    ai_payoffs[:] = [fp_ai, tp_ai]
+    ftc_payoffs[:] = [fp_ftc, tp_ftc]
+    cdef double prob_bias, checked_thresh, signal_thresh, v
+    cdef int ai_high, pays_for_check, signal, confirmed
+
+    ai_invests_high = np.empty(n_rounds, dtype=np.bool_)
+    auditor_pays_for_check = np.empty(n_rounds, dtype=np.bool_)
+    signal_bias = np.empty(n_rounds, dtype=np.bool_)
+    ai_safety_effect = np.empty(n_rounds, dtype=np.float64)
+    auditor_check_effect = np.empty(n_rounds, dtype=np.float64)
+    ai_wager_effect = np.empty(n_rounds, dtype=np.float64)
+    auditor_wager_effect = np.empty(n_rounds, dtype=np.float64)
+    ftc_surplus = np.empty(n_rounds, dtype=np.float64)
+
+    cdef unsigned char[::1] ai_invests_high_v = ai_invests_high.view(np.uint8)
+    cdef unsigned char[::1] auditor_pays_for_check_v = auditor_pays_for_check.view(np.uint8)
+    cdef unsigned char[::1] signal_bias_v = signal_bias.view(np.uint8)
+    cdef double[::1] ai_safety_effect_v = ai_safety_effect
+    cdef double[::1] auditor_check_effect_v = auditor_check_effect
+    cdef double[::1] ai_wager_effect_v = ai_wager_effect
+    cdef double[::1] auditor_wager_effect_v = auditor_wager_effect
+    cdef double[::1] ftc_surplus_v = ftc_surplus
+
+    for round_i in range(n_rounds):
+        # 1. AI Company Safety Investment
+        ai_high = coins[round_i] & 1
+        if ai_high:
+            prob_bias = prob_bias_high
+            checked_thresh = checked_thresh_high
+            ai_safety_effect_v[round_i] = -cost_high_safety
+        else:
+            prob_bias = prob_bias_low
+            checked_thresh = checked_thresh_low
+            ai_safety_effect_v[round_i] = -cost_low_safety
+
+        # 2. Auditor Check Decision for due diligence:
+        pays_for_check = (coins[round_i] >> 1) & 1
+        if pays_for_check:
+            auditor_check_effect_v[round_i] = -auditor_check_cost
+            signal_thresh = checked_thresh
+        else:
+            auditor_check_effect_v[round_i] = 0
+            signal_thresh = prob_bias
+
+        # 3. Wager Decision. No signal is the common case, so it is the fall-through
+        # with zero wager effects and the signal branch is marked unlikely; with a
+        # signal, the bias confirmation indexes the payoff tables without a branch.
+        v = u[round_i]
+        signal = v < signal_thresh
+        auditor_wager_effect_v[round_i] = 0
+        ai_wager_effect_v[round_i] = 0
+        ftc_surplus_v[round_i] = 0
+        if unlikely(signal):
+            confirmed = v < signal_thresh * prob_bias
+            auditor_wager_effect_v[round_i] = auditor_payoffs[confirmed]
+            ai_wager_effect_v[round_i] = ai_payoffs[confirmed]
+            ftc_surplus_v[round_i] = ftc_payoffs[confirmed]
+
+        ai_invests_high_v[round_i] = ai_high
+        auditor_pays_for_check_v[round_i] = pays_for_check
+        signal_bias_v[round_i] = signal
+
+    return (ai_invests_high, auditor_pays_for_check, signal_bias, signal_bias.copy(),
+            ai_safety_effect, auditor_check_effect, ai_wager_effect,
+            auditor_wager_effect, ftc_surplus)
@@ -0,0 +1,129 @@
+import dataclasses
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import cs121
+
+PARAMS = (100.0, 40.0, 0.05, 0.3, 0.9, 5.0, 50.0, 1000.0)
+
+
+class KernelTestCase(unittest.TestCase):
+    """Feeds the same draws to a round kernel and to simulate_game's vectorized kernel."""
+
+    def setUp(self):
+        self.coins, self.u = cs121._draw_rounds(np.random.default_rng(0), 2000)
+        self.packed = (self.coins[:, 0].astype(np.int64)
+                       | (self.coins[:, 1].astype(np.int64) << 1))
+        self.expected = cs121._specialized_kernel(*PARAMS)(self.coins, self.u)
+
+    def assertColumnsEqual(self, actual):
+        self.assertEqual(len(self.expected), len(actual))
+        for want, got in zip(self.expected, actual):
+            self.assertEqual(want.dtype, got.dtype)
+            np.testing.assert_array_equal(want, got)
+
+
+class HistoryColumnsTest(unittest.TestCase):
+
+    def test_columns_are_independent_contiguous_arrays(self):
+        for simulate in (cs121.simulate_game, cs121.simulate_game_loop):
+            history, _, _ = simulate(n_rounds=100, seed=3)
+            columns = [getattr(history, field.name) for field in dataclasses.fields(history)]
+            for i, column in enumerate(columns):
+                self.assertTrue(column.flags.c_contiguous)
+                for other in columns[i + 1:]:
+                    self.assertFalse(np.shares_memory(column, other))
+
+
+class LoopVariantTest(KernelTestCase):
+
+    @unittest.skipUnless(cs121._numba_available, 'Numba is not installed')
+    def test_numba_kernel_matches_vectorized_kernel(self):
+        self.assertColumnsEqual(cs121._simulate_rounds(self.packed, self.u, *PARAMS))
+
+    def test_variants_share_history(self):
+        history, final_ai, final_auditor = cs121.simulate_game(n_rounds=500, seed=42)
+        loop_history, loop_ai, loop_auditor = cs121.simulate_game_loop(n_rounds=500, seed=42)
+        for field in dataclasses.fields(cs121.History):
+            np.testing.assert_array_equal(getattr(history, field.name),
+                                          getattr(loop_history, field.name))
+        self.assertEqual((final_ai, final_auditor), (loop_ai, loop_auditor))
+
+
+class PythonKernelTest(KernelTestCase):
+
+    def test_matches_vectorized_kernel(self):
+        with mock.patch.object(cs121, '_numba_available', False):
+            columns = cs121._simulate_rounds(self.packed, self.u, *PARAMS)
+        self.assertColumnsEqual(columns)
+
+
+@unittest.skipIf(cs121._simulate_rounds_cython is None, 'cs121_kernel is not built')
+class CythonKernelTest(KernelTestCase):
+
+    def test_matches_vectorized_kernel(self):
+        self.assertColumnsEqual(cs121._simulate_rounds_cython(self.packed, self.u, *PARAMS))
+
+
+class SummarizeTest(unittest.TestCase):
+
+    def test_matches_masked_means(self):
+        history, _, _ = cs121.simulate_game(n_rounds=2000, seed=7)
+        summary = cs121.summarize(history)
+        outcomes = {'avg_ai_outcome': history.incremental_ai,
+                    'avg_auditor_outcome': history.incremental_auditor,
+                    'avg_ftc_surplus': history.ftc_surplus}
+        for bucket in ('ai_invests_high', 'auditor_pays_for_check', 'wager_placed'):
+            decision = getattr(history, bucket)
+            for group, mask in (('true', decision), ('false', ~decision)):
+                result = summary[bucket][group]
+                self.assertEqual(result['count'], mask.sum())
+                for key, column in outcomes.items():
+                    if bucket == 'wager_placed' and group == 'false':
+                        expected = 0
+                    else:
+                        expected = column[mask].mean()
+                    self.assertAlmostEqual(result[key], expected)
+
+    def test_empty_history(self):
+        history, _, _ = cs121.simulate_game(n_rounds=0, seed=1)
+        summary = cs121.summarize(history)
+        self.assertEqual(summary['wager_placed']['true'],
+                         {'count': 0, 'avg_ai_outcome': 0, 'avg_auditor_outcome': 0,
+                          'avg_ftc_surplus': 0})
+
+
+
+class ReplicationsTest(unittest.TestCase):
+
+    def test_independent_of_process_count(self):
+        two = cs121.run_replications(20, n_rounds=100, seed=3, processes=2)
+        five = cs121.run_replications(20, n_rounds=100, seed=3, processes=5)
+        for two_processes, five_processes in zip(two, five):
+            np.testing.assert_array_equal(two_processes, five_processes)
+
+    def test_no_replications(self):
+        final_ai, final_auditor = cs121.run_replications(0)
+        self.assertEqual(final_ai.shape, (0,))
+        self.assertEqual(final_auditor.shape, (0,))
+
+    def test_params_reach_simulate_game(self):
+        params = {'fine_amount': 0.0, 'wager_amount': 7.0}
+        final_ai, final_auditor = cs121.run_replications(3, n_rounds=100, seed=5,
+                                                         processes=2, **params)
+        for i, child in enumerate(np.random.SeedSequence(5).spawn(3)):
+            _, want_ai, want_auditor = cs121.simulate_game(n_rounds=100, seed=child, **params)
+            self.assertEqual(final_ai[i], want_ai)
+            self.assertEqual(final_auditor[i], want_auditor)
+
+    def test_cpu_count_unknown(self):
+        with mock.patch.object(cs121.os, 'cpu_count', return_value=None):
+            final_ai, final_auditor = cs121.run_replications(2, n_rounds=10, seed=1)
+        self.assertEqual(final_ai.shape, (2,))
+        self.assertEqual(final_auditor.shape, (2,))
+
+
+if __name__ == '__main__':
+    unittest.main()